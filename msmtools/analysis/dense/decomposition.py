@@ -30,7 +30,7 @@ import numpy as np
 import numbers
 import warnings
 
-from scipy.linalg import eig, eigh, eigvals, eigvalsh, solve
+from scipy.linalg import eig, eigh, eigvals, eigvalsh, eigvals_banded, solve
 
 from ...util.exceptions import SpectralWarning, ImaginaryEigenValueWarning
 
@@ -94,7 +94,7 @@ def eigenvalues(T, k=None, reversible=False, mu=None):
         return evals
 
 
-def eigenvalues_rev(T, k=None, mu=None):
+def eigenvalues_rev(T, k=None, mu=None, try_banded=True):
     r"""Compute eigenvalues of reversible transition matrix.
 
     Parameters
@@ -105,6 +105,8 @@ def eigenvalues_rev(T, k=None, mu=None):
         Compute the first k eigenvalues of T
     mu : (d,) ndarray, optional
         Stationary distribution of T
+    try_banded : bool, optional
+        Check whether T is banded and use a banded solver if so
 
     Returns
     -------
@@ -118,6 +120,12 @@ def eigenvalues_rev(T, k=None, mu=None):
     ValueError
         If stationary distribution is nonpositive.
 
+    Notes
+    -----
+    If try_banded=True and the bandwidth of T is below d/20 (e.g. for a
+    birth-death chain) the eigenvalues are computed with a solver for
+    symmetric banded matrices.
+
     """
 
     """compute stationary distribution if not given"""
@@ -129,10 +137,33 @@ def eigenvalues_rev(T, k=None, mu=None):
     smu = np.sqrt(mu)
     S = smu[:,None] * T / smu
     """ symmetric eigenvalue problem """
-    evals = eigvalsh(S)
+    bw = _bandwidth(S, -(-S.shape[0] // 20)) if try_banded else None
+    if bw is not None:
+        """Banded S (e.g. birth-death chains), use lower banded storage"""
+        ab = np.zeros((bw + 1, S.shape[0]))
+        for i in range(bw + 1):
+            ab[i, :S.shape[0] - i] = np.diagonal(S, -i)
+        evals = eigvals_banded(ab, lower=True)
+    else:
+        evals = eigvalsh(S, overwrite_a=True)
     return evals
 
 
+def _bandwidth(A, maxbw):
+    r"""Lower bandwidth of A if it is smaller than maxbw, None otherwise."""
+    n = A.shape[0]
+    if maxbw < n:
+        """Dense matrices almost always fail here, at O(n) cost"""
+        if np.diagonal(A, -maxbw).any():
+            return None
+        if np.tril(A, -maxbw).any():
+            return None
+    for i in range(min(maxbw, n) - 1, 0, -1):
+        if np.diagonal(A, -i).any():
+            return i
+    return 0
+
+
 def eigenvectors(T, k=None, right=True, reversible=False, mu=None):
     r"""Compute eigenvectors of transition matrix.
 
@@ -248,7 +279,7 @@ def eigenvectors_rev(T, right=True, mu=None):
     """ symmetrize T """
     smu = np.sqrt(mu)
     S = smu[:,None] * T / smu
-    val, eigvec = eigh(S)
+    val, eigvec = eigh(S, overwrite_a=True)
     """Sort eigenvectors"""
     perm = np.argsort(np.abs(val))[::-1]
     eigvec = eigvec[:, perm]
@@ -304,7 +335,11 @@ def rdl_decomposition(T, k=None, reversible=False, norm='standard', mu=None):
     """
     # auto-set norm
     if norm == 'auto':
-        if is_reversible(T):
+        """Compute the stationary distribution once and share it with the
+        reversible decomposition below"""
+        if mu is None:
+            mu = stationary_distribution(T)
+        if is_reversible(T, mu=mu):
             norm = 'reversible'
         else:
             norm = 'standard'
@@ -446,7 +481,7 @@ def rdl_decomposition_rev(T, norm='reversible', mu=None):
     """ symmetrize T """
     smu = np.sqrt(mu)
     S = smu[:,None] * T / smu
-    val, eigvec = eigh(S)
+    val, eigvec = eigh(S, overwrite_a=True)
     """Sort eigenvalues and eigenvectors"""
     perm = np.argsort(np.abs(val))[::-1]
     val = val[perm]
@@ -513,16 +548,8 @@ def timescales(T, tau=1, k=None, reversible=False, mu=None):
     reversible=True.
 
     """
-    values = eigenvalues(T, reversible=reversible, mu=mu)
-
-    """Sort by absolute value"""
-    ind = np.argsort(np.abs(values))[::-1]
-    values = values[ind]
-
-    if k is None:
-        values = values
-    else:
-        values = values[0:k]
+    """Eigenvalues are returned sorted by decreasing absolute value"""
+    values = eigenvalues(T, k=k, reversible=reversible, mu=mu)
 
     """Compute implied time scales"""
     return timescales_from_eigenvalues(values, tau)
@@ -26,7 +26,9 @@ https://github.com/CMD-at-ZIB/ZIBMolPy/blob/master/ZIBMolPy_package/ZIBMolPy/alg
 import warnings
 import numpy as np
 from scipy.sparse import issparse
-import math
+
+# imaginary parts of the eigenvectors below this fraction of their largest real part are treated as round-off
+_COMPLEX_EIGENVECTOR_RTOL = 1e-12
 
 
 def _pcca_connected_isa(evec, n_clusters):
@@ -280,13 +282,13 @@ def _pcca_connected(P, n, return_rot=False):
     evecs = eigenvectors(P, n)
 
     # orthonormalize
-    for i in range(n):
-        evecs[:, i] /= math.sqrt(np.dot(evecs[:, i] * pi, evecs[:, i]))
+    evecs /= np.sqrt(np.dot(pi, evecs * evecs))
     # make first eigenvector positive
     evecs[:, 0] = np.abs(evecs[:, 0])
 
     # Is there a significant complex component?
-    if not np.alltrue(np.isreal(evecs)):
+    if np.iscomplexobj(evecs) and \
+            np.max(np.abs(evecs.imag)) > _COMPLEX_EIGENVECTOR_RTOL * np.max(np.abs(evecs.real)):
         warnings.warn(
             "The given transition matrix has complex eigenvectors, so it doesn't exactly fulfill detailed balance "
             + "forcing eigenvectors to be real and continuing. Be aware that this is not theoretically solid.")
@@ -308,8 +310,7 @@ def _pcca_connected(P, n, return_rot=False):
     memberships = np.maximum(0.0, memberships)
     memberships = np.minimum(1.0, memberships)
     # print "memberships unnormalized: ",memberships
-    for i in range(0, np.shape(memberships)[0]):
-        memberships[i] /= np.sum(memberships[i])
+    memberships /= np.sum(memberships, axis=1)[:, np.newaxis]
 
     # print "final chi = \n",chi
 
@@ -393,22 +394,22 @@ def pcca(P, m):
         raise ValueError("Number of metastable states m = " + str(m) + " is too small. Transition matrix has " +
                          str(len(closed_components)) + " disconnected components")
 
-    # We collect eigenvalues in order to decide which
+    # We collect eigenvalues in order to decide which components to cluster.
+    # The flat arrays are preallocated, each component fills its own slice
     closed_components_Psub = []
-    closed_components_ev = []
-    closed_components_enum = []
+    closed_components_ev_flat = np.empty(closed_states.size, dtype=complex)
+    closed_components_enum_flat = np.empty(closed_states.size, dtype=int)
+    offset = 0
     for i in range(n_closed_components):
         component = closed_components[i]
         # print "component ",i," ",component
         # compute eigenvalues in submatrix
-        Psub = P[component, :][:, component]
+        Psub = P[np.ix_(component, component)]
         closed_components_Psub.append(Psub)
-        closed_components_ev.append(eigenvalues(Psub))
-        closed_components_enum.append(i * np.ones((component.size), dtype=int))
+        closed_components_ev_flat[offset:offset + component.size] = eigenvalues(Psub)
+        closed_components_enum_flat[offset:offset + component.size] = i
+        offset += component.size
 
-    # flatten
-    closed_components_ev_flat = np.hstack(closed_components_ev)
-    closed_components_enum_flat = np.hstack(closed_components_enum)
     # which components should be clustered?
     component_indexes = closed_components_enum_flat[np.argsort(closed_components_ev_flat)][0:m]
     # cluster each component
@@ -441,9 +442,8 @@ def pcca(P, m):
         for i in range(closed_states.size):
             # hitting probability to each closed state
             h = hitting_probability(Pabs, closed_states[i])
-            for j in range(transition_states.size):
-                # transition states belong to closed states with the hitting probability, and inherit their chi
-                chi[transition_states[j]] += h[transition_states[j]] * chi[closed_states[i]]
+            # transition states belong to closed states with the hitting probability, and inherit their chi
+            chi[transition_states] += h[transition_states, np.newaxis] * chi[closed_states[i]]
 
     # check if we have m metastable sets. If less than m, we must raise
     nmeta = np.count_nonzero(chi.sum(axis=0))
@@ -291,7 +291,11 @@ def rdl_decomposition(T, k=None, norm='auto', ncv=None, reversible=False, mu=Non
         raise ValueError("Number of eigenvectors required for decomposition of sparse matrix")
     # auto-set norm
     if norm == 'auto':
-        if is_reversible(T):
+        """Compute the stationary distribution once and share it with the
+        reversible decomposition below"""
+        if mu is None:
+            mu = stationary_distribution(T)
+        if is_reversible(T, mu=mu):
             norm = 'reversible'
         else:
             norm = 'standard'
@@ -501,7 +505,7 @@ def timescales(T, tau=1, k=None, ncv=None, reversible=False, mu=None):
     """
     if k is None:
         raise ValueError("Number of time scales required for decomposition of sparse matrix")
-    values = eigenvalues(T, k=k, ncv=ncv, reversible=reversible)
+    values = eigenvalues(T, k=k, ncv=ncv, reversible=reversible, mu=mu)
 
     """Check for dominant eigenvalues with large imaginary part"""
     if not np.allclose(values.imag, 0.0):
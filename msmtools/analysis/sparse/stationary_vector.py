@@ -98,7 +98,7 @@ def stationary_distribution_from_backward_iteration(P, eps=1e-15):
     return pi
 
 
-def stationary_distribution_from_eigenvector(T, ncv=None):
+def stationary_distribution_from_eigenvector(T, ncv=None, v0=None):
     r"""Compute stationary distribution of stochastic matrix T.
 
     The stationary distribution is the left eigenvector corresponding to the 1
@@ -111,6 +111,9 @@ def stationary_distribution_from_eigenvector(T, ncv=None):
     ncv : int (optional)
         The number of Lanczos vectors generated, `ncv` must be greater than k;
         it is recommended that ncv > 2*k
+    v0 : numpy array, shape(d,) (optional)
+        Starting vector for the Arnoldi iteration, e.g. a previous
+        approximation of the stationary distribution. Random if not given.
 
     Returns
     -------
@@ -118,7 +121,7 @@ def stationary_distribution_from_eigenvector(T, ncv=None):
         Vector of stationary probabilities.
 
     """
-    vals, vecs = scipy.sparse.linalg.eigs(T.transpose(), k=1, which='LR', ncv=ncv)
+    vals, vecs = scipy.sparse.linalg.eigs(T.transpose(), k=1, which='LR', ncv=ncv, v0=v0)
     nu = vecs[:, 0].real
     mu = nu / np.sum(nu)
     return mu
@@ -141,15 +144,17 @@ def stationary_distribution(T):
 
     """
     fallback = False
+    v0 = None
     try:
         mu = stationary_distribution_from_backward_iteration(T)
         if np.any(mu < 0):  # numerical problem, fall back to more robust algorithm.
             fallback=True
+            v0 = mu  # but start it from the approximation we already have
     except RuntimeError:
         fallback = True
 
     if fallback:
-        mu = stationary_distribution_from_eigenvector(T)
+        mu = stationary_distribution_from_eigenvector(T, v0=v0)
         if np.any(mu < 0):  # still? Then set to 0 and renormalize
             mu = np.maximum(mu, 0.0)
             mu /= mu.sum()
@@ -24,6 +24,7 @@ import warnings
 import numpy as np
 import scipy as sp
 import scipy.sparse
+import scipy.linalg
 
 from scipy.optimize import fmin_l_bfgs_b
 from scipy.special import exprel
@@ -77,7 +78,8 @@ def eigen_decomposition(M, pi):
     # eigen decomposition for reversible transition matrix
     sqrt_pi = np.sqrt(pi)
     Msym = sqrt_pi[:, np.newaxis] * M / sqrt_pi  # Msym_ij = M_ij sqrt(pi_i/pi_j)
-    lam, B = np.linalg.eigh(Msym)
+    # Msym is a temporary, let LAPACK work in place and skip the finiteness scan
+    lam, B = sp.linalg.eigh(Msym, overwrite_a=True, check_finite=False)
     A = B / sqrt_pi[:, np.newaxis]  # A_ij = B_ij / sqrt(pi_i)
     Ainv = B.T * sqrt_pi  # Ainv_ij = B_ji * sqrt(pi_j)
     A = np.ascontiguousarray(A)
@@ -34,7 +34,7 @@ from scipy.linalg import eigvals
 from msmtools.util.exceptions import SpectralWarning, ImaginaryEigenValueWarning
 
 from msmtools.analysis.dense.decomposition import eigenvalues, eigenvectors, rdl_decomposition
-from msmtools.analysis.dense.decomposition import timescales
+from msmtools.analysis.dense.decomposition import timescales, eigenvalues_rev
 
 
 class TestDecomposition(unittest.TestCase):
@@ -83,6 +83,34 @@ class TestDecomposition(unittest.TestCase):
         evn = eigenvalues(P, reversible=True, mu=self.bdc.stationary_distribution())
         assert_allclose(ev, evn)
 
+    def test_eigenvalues_reversible_banded(self):
+        """Reversible matrix with bandwidth 3"""
+        C = np.zeros((self.dim, self.dim))
+        for i in range(4):
+            C += np.diag(np.random.random(self.dim - i), -i)
+        C = C + C.T
+        P = C / C.sum(axis=1)[:, np.newaxis]
+        ev = eigvals(P)
+        ev = ev[np.argsort(np.abs(ev))[::-1]]
+
+        evn = eigenvalues(P, reversible=True)
+        assert_allclose(ev, evn)
+
+        evb = np.sort(eigenvalues_rev(P, try_banded=True))
+        evd = np.sort(eigenvalues_rev(P, try_banded=False))
+        assert_allclose(evb, evd)
+
+    def test_eigenvalues_reversible_dense(self):
+        """Reversible matrix with full sparsity pattern, not banded"""
+        C = np.random.random((self.dim, self.dim))
+        C = C + C.T
+        P = C / C.sum(axis=1)[:, np.newaxis]
+        ev = eigvals(P)
+        ev = ev[np.argsort(np.abs(ev))[::-1]]
+
+        evn = eigenvalues(P, reversible=True)
+        assert_allclose(ev, evn)
+
     def test_eigenvectors(self):
         P = self.bdc.transition_matrix()
 
@@ -341,6 +369,40 @@ class TestDecomposition(unittest.TestCase):
         assert_allclose(7 * ts[1:self.k], tsn[1:])
 
 
+class TestDecompositionNonReversible(unittest.TestCase):
+    def setUp(self):
+        """Non-reversible matrices with complex conjugate eigenvalue pairs"""
+        self.P = np.array([[0.1, 0.8, 0.1], [0.1, 0.1, 0.8], [0.8, 0.1, 0.1]])
+        np.random.seed(42)
+        C = np.random.random((20, 20))
+        self.Q = C / C.sum(axis=1)[:, np.newaxis]
+
+    def test_eigenvalues_k(self):
+        for P in (self.P, self.Q):
+            ev = eigenvalues(P)
+            for k in range(1, P.shape[0] + 1):
+                evn = eigenvalues(P, k=k)
+                assert_allclose(ev[0:k], evn)
+
+    def test_eigenvalues_eigenvectors_k(self):
+        for P in (self.P, self.Q):
+            for k in range(1, P.shape[0] + 1):
+                evn = eigenvalues(P, k=k)
+                Rn = eigenvectors(P, k=k)
+                assert_allclose(np.dot(P, Rn), np.dot(Rn, np.diag(evn)))
+
+    def test_timescales_k(self):
+        for P in (self.P, self.Q):
+            ev = eigenvalues(P)
+            ts = -1.0 / np.log(np.abs(ev))
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", ImaginaryEigenValueWarning)
+                for k in range(2, P.shape[0] + 1):
+                    tsn = timescales(P, k=k)
+                    assert_allclose(ts[1:k], tsn[1:])
+                    assert_allclose(timescales(P)[0:k], tsn)
+
+
 class TestTimescales(unittest.TestCase):
     def setUp(self):
         self.T = np.array([[0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [1.0, 0.0, 0.0]])
@@ -25,10 +25,13 @@ This module provides the unittest for the pcca module
 
 '''
 import unittest
+import warnings
+from unittest import mock
 import numpy as np
 
 from tests.numeric import assert_allclose
-from msmtools.analysis.dense.pcca import pcca, coarsegrain, PCCA
+import msmtools.analysis
+from msmtools.analysis.dense.pcca import pcca, coarsegrain, PCCA, _pcca_connected
 
 
 class TestPCCA(unittest.TestCase):
@@ -46,6 +49,30 @@ class TestPCCA(unittest.TestCase):
         with self.assertRaises(ValueError):
             pcca(P, 2)
 
+    def _pcca_with_imaginary_eigenvectors(self, eps):
+        """Run _pcca_connected with an imaginary part of relative size eps added to the eigenvectors"""
+        P = np.array([[0.9, 0.1, 0.0, 0.0],
+                      [0.1, 0.8, 0.1, 0.0],
+                      [0.0, 0.1, 0.8, 0.1],
+                      [0.0, 0.0, 0.1, 0.9]])
+        eigenvectors = msmtools.analysis.eigenvectors
+
+        def complex_eigenvectors(T, k):
+            R = eigenvectors(T, k)
+            return R + 1j * eps * np.max(np.abs(R)) * np.ones_like(R)
+
+        with mock.patch.object(msmtools.analysis, 'eigenvectors', side_effect=complex_eigenvectors):
+            return _pcca_connected(P, 2)
+
+    def test_pcca_complex_eigenvectors_roundoff(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self._pcca_with_imaginary_eigenvectors(1e-15)
+
+    def test_pcca_complex_eigenvectors(self):
+        with self.assertWarns(UserWarning):
+            self._pcca_with_imaginary_eigenvectors(1e-3)
+
     def test_pcca_1(self):
         P = np.array([[1, 0],
                       [0, 1]])
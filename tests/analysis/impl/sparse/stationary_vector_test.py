@@ -22,6 +22,7 @@ r"""Test package for the decomposition module
 
 """
 import unittest
+from unittest import mock
 
 import numpy as np
 from msmtools.util.birth_death_chain import BirthDeathChain
@@ -29,6 +30,7 @@ from tests.numeric import assert_allclose
 
 from msmtools.analysis.sparse.stationary_vector import stationary_distribution_from_eigenvector
 from msmtools.analysis.sparse.stationary_vector import stationary_distribution_from_backward_iteration
+from msmtools.analysis.sparse import stationary_vector
 
 
 class TestStationaryVector(unittest.TestCase):
@@ -55,6 +57,28 @@ class TestStationaryVector(unittest.TestCase):
         mun = stationary_distribution_from_eigenvector(P, ncv=self.ncv)
         assert_allclose(mu, mun)
 
+    def test_statdist_decomposition_v0(self):
+        P = self.bdc.transition_matrix_sparse()
+        mu = self.bdc.stationary_distribution()
+        v0 = mu + 1e-3 * np.random.random(self.dim)
+        mun = stationary_distribution_from_eigenvector(P, ncv=self.ncv, v0=v0)
+        assert_allclose(mu, mun)
+
+    def test_statdist_fallback_v0(self):
+        """Negative backward iteration estimate is reused as Arnoldi start vector"""
+        P = self.bdc.transition_matrix_sparse()
+        mu = self.bdc.stationary_distribution()
+        estimate = mu.copy()
+        estimate[0] = -1e-10
+        with mock.patch.object(stationary_vector, 'stationary_distribution_from_backward_iteration',
+                               return_value=estimate), \
+                mock.patch.object(stationary_vector, 'stationary_distribution_from_eigenvector',
+                                  wraps=stationary_distribution_from_eigenvector) as from_eigenvector:
+            mun = stationary_vector.stationary_distribution(P)
+        from_eigenvector.assert_called_once()
+        assert from_eigenvector.call_args[1]['v0'] is estimate
+        assert_allclose(mu, mun)
+
     def test_statdist_iteration(self):
         P = self.bdc.transition_matrix_sparse()
         mu = self.bdc.stationary_distribution()